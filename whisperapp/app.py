@@ -5,9 +5,11 @@ import sys
 import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import rumps
+from PyObjCTools import AppHelper
 
 from .database import Database
 from .recorder import AudioRecorder
@@ -26,6 +28,9 @@ logging.basicConfig(
 )
 log = logging.getLogger('whisperapp')
 
+# Shared worker pool for blocking I/O such as model downloads
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="whisperapp-io")
+
 
 class WhisperApp(rumps.App):
     """
@@ -56,6 +61,7 @@ class WhisperApp(rumps.App):
         self.db = Database()
         log.debug("Creating audio recorder...")
         self.recorder = AudioRecorder()
+        rumps.events.before_quit.register(self.recorder.close)
         log.debug("Creating text cleaner...")
         self.cleaner = TextCleaner(use_llm=True)
         self.hotkey_manager: Optional[HotkeyManager] = None
@@ -77,6 +83,9 @@ class WhisperApp(rumps.App):
         # Pre-load models in background (optional, for faster first use)
         log.debug("Starting model preload thread...")
         threading.Thread(target=self._preload_models, daemon=True).start()
+        
+        # Build the Settings window once the run loop is up, so the first open is instant
+        AppHelper.callLater(1.0, self._prewarm_settings)
         log.info("✓ WhisperApp initialized! Hold Right ⌘ to record.")
     
     def _build_menu(self):
@@ -84,11 +93,15 @@ class WhisperApp(rumps.App):
         # Build model submenu
         model_menu = self._build_model_menu()
         
+        # Kept so status/cleanup updates don't have to search the menu
+        self.status_item = rumps.MenuItem("Status: Ready", callback=None)
+        self.cleanup_menu_item = rumps.MenuItem("Cleanup: ON", callback=self._toggle_cleanup)
+        
         self.menu = [
-            rumps.MenuItem("Status: Ready", callback=None),
+            self.status_item,
             None,  # Separator
             model_menu,
-            rumps.MenuItem("Cleanup: ON", callback=self._toggle_cleanup),
+            self.cleanup_menu_item,
             None,  # Separator
             rumps.MenuItem("History", callback=self.show_history),
             rumps.MenuItem("Statistics", callback=self.show_statistics),
@@ -123,13 +136,21 @@ class WhisperApp(rumps.App):
     
     def _on_model_select(self, sender):
         """Handle model selection from menu."""
-        from .models import AVAILABLE_MODELS, is_model_downloaded, download_model
+        self.select_model(sender._model_key)
+    
+    def select_model(self, model_key: str) -> bool:
+        """
+        Switch to a model, downloading it first (after confirmation) if needed.
+        
+        Returns:
+            False if the model is unknown or the download was declined
+        """
+        from .models import AVAILABLE_MODELS, is_model_downloaded
         
-        model_key = sender._model_key
         model_info = AVAILABLE_MODELS.get(model_key)
         
         if not model_info:
-            return
+            return False
         
         # Check if downloaded
         if not is_model_downloaded(model_key):
@@ -142,27 +163,43 @@ class WhisperApp(rumps.App):
             )
             
             if response != 1:  # Not OK
-                return
+                return False
             
-            # Download in background
-            self._update_status(f"Downloading {model_info.name}...", "📥")
-            
-            def do_download():
-                success = download_model(model_key)
-                if success:
-                    self.current_model = model_key
-                    self._update_model_menu()
-                    self._update_status("Ready", "🎤")
-                    log.info(f"Switched to model: {model_info.name}")
-                else:
-                    self._update_status("Download failed", "⚠️")
-            
-            threading.Thread(target=do_download, daemon=True).start()
+            self.download_and_select(model_key)
         else:
             # Already downloaded, just switch
             self.current_model = model_key
             self._update_model_menu()
             log.info(f"Switched to model: {model_info.name}")
+        
+        return True
+    
+    def download_and_select(self, model_key: str):
+        """Download a model in the background, without asking, and switch to it when done."""
+        from .models import AVAILABLE_MODELS, download_model
+        
+        model_info = AVAILABLE_MODELS[model_key]
+        self._update_status(f"Downloading {model_info.name}...", "📥")
+        
+        def on_downloaded(success):
+            # Runs on the main thread - menu items are AppKit objects
+            if success:
+                from .preferences import mark_model_downloaded
+                self.current_model = model_key
+                self._update_model_menu()
+                mark_model_downloaded(model_key)
+                self._update_status("Ready", "🎤")
+                log.info(f"Switched to model: {model_info.name}")
+            else:
+                from .preferences import reset_model_selection
+                reset_model_selection()
+                self._update_status("Download failed", "⚠️")
+        
+        def do_download():
+            success = download_model(model_key)
+            AppHelper.callAfter(on_downloaded, success)
+        
+        _IO_POOL.submit(do_download)
     
     def _update_model_menu(self):
         """Update model menu checkmarks and title."""
@@ -184,12 +221,16 @@ class WhisperApp(rumps.App):
     
     def _toggle_cleanup(self, sender):
         """Toggle between raw and cleanup mode."""
-        self.cleanup_enabled = not self.cleanup_enabled
-        if self.cleanup_enabled:
-            sender.title = "Cleanup: ON"
+        self.set_cleanup_enabled(not self.cleanup_enabled)
+    
+    def set_cleanup_enabled(self, enabled: bool):
+        """Switch cleanup mode and keep the menu item title in sync."""
+        self.cleanup_enabled = enabled
+        if enabled:
+            self.cleanup_menu_item.title = "Cleanup: ON"
             log.info("Cleanup mode: ON (formatting enabled)")
         else:
-            sender.title = "Cleanup: OFF"
+            self.cleanup_menu_item.title = "Cleanup: OFF"
             log.info("Cleanup mode: OFF (raw transcription)")
     
     def _start_hotkey_listener(self):
@@ -205,6 +246,21 @@ class WhisperApp(rumps.App):
     
     def _preload_models(self):
         """Pre-load transcription and cleanup models in background."""
+        try:
+            self.recorder.prepare()
+        except Exception as e:
+            log.warning(f"Could not prepare audio input: {e}")
+        
+        try:
+            from .transcribe import warmup
+            log.debug(f"Pre-loading transcription model ({self.current_model})...")
+            if warmup(self.current_model):
+                log.info("✓ Transcription model loaded")
+            else:
+                log.debug(f"Skipped pre-loading, model not downloaded: {self.current_model}")
+        except Exception as e:
+            log.warning(f"Could not pre-load transcription model: {e}")
+        
         try:
             log.debug("Pre-loading cleanup model (Llama 3B)...")
             # Pre-warm the cleaner (loads Llama model)
@@ -213,17 +269,15 @@ class WhisperApp(rumps.App):
         except Exception as e:
             log.warning(f"Could not pre-load models: {e}")
     
+    def _prewarm_settings(self):
+        """Build the preferences window ahead of the first Settings click."""
+        from .preferences import prewarm_preferences
+        prewarm_preferences(self)
+    
     def _update_status(self, status: str, icon: str = "🎤"):
         """Update the menu bar status."""
         self.title = icon
-        if "Status:" in self.menu.keys():
-            self.menu["Status: Ready"].title = f"Status: {status}"
-        else:
-            # Find and update the status item
-            for item in self.menu.values():
-                if hasattr(item, 'title') and item.title.startswith("Status:"):
-                    item.title = f"Status: {status}"
-                    break
+        self.status_item.title = f"Status: {status}"
     
     def _on_recording_start(self):
         """Called when the push-to-talk key is pressed."""
@@ -320,18 +374,18 @@ class WhisperApp(rumps.App):
             except Exception as e:
                 log.warning(f"Could not set processing mode: {e}")
             
-            # Stop recording and get audio file
+            # Stop recording and take the samples straight from memory
             log.debug("Stopping recorder...")
-            wav_path = self.recorder.stop()
+            audio = self.recorder.stop_array()
             duration = self.recorder.last_duration
-            log.info(f"Recorded {duration:.2f}s to {wav_path}")
+            log.info(f"Recorded {duration:.2f}s")
             
             # Transcribe audio
             from .models import AVAILABLE_MODELS
             model_info = AVAILABLE_MODELS.get(self.current_model)
             model_name = model_info.name if model_info else self.current_model
             log.info(f"Transcribing with {model_name}...")
-            raw_text = transcribe(wav_path, model_key=self.current_model)
+            raw_text = transcribe(audio, model_key=self.current_model)
             log.info(f"Raw transcription: '{raw_text}'")
             
             if not raw_text:
@@ -377,12 +431,6 @@ class WhisperApp(rumps.App):
             
             # Reset status after a delay
             threading.Timer(2.0, lambda: self._update_status("Ready", "🎤")).start()
-            
-            # Clean up temp file
-            try:
-                os.remove(wav_path)
-            except:
-                pass
                 
         except Exception as e:
             log.error(f"Error processing recording: {e}", exc_info=True)
@@ -2,14 +2,30 @@
 Recording indicator - polished floating pill with audio visualization.
 Shows a modern, glowing indicator when recording.
 """
+import array
 import threading
 import logging
 from typing import Optional
 
 log = logging.getLogger(__name__)
 
-# Indicator state
-_indicator = None
+# Main-thread dispatcher: a tiny NSObject whose run: method invokes a callable,
+# so cross-thread hops go straight through performSelectorOnMainThread.
+try:
+    import objc
+    from Foundation import NSObject
+
+    class _MainThreadRunner(NSObject):
+        @objc.typedSelector(b"v@:@")
+        def run_(self, func):
+            try:
+                func()
+            except Exception as e:
+                log.error(f"Main thread callback failed: {e}")
+
+    _main_runner = _MainThreadRunner.alloc().init()
+except ImportError:
+    _main_runner = None
 
 
 class RecordingIndicator:
@@ -20,7 +36,8 @@ class RecordingIndicator:
         self.view = None
         self.is_visible = False
         self.is_processing = False  # True when showing loading state
-        self.current_level = 0.0
+        self._level = array.array('f', [0.0])  # Written by audio thread, read per frame
+        self._phase = 0.0
         self._update_thread = None
         self._initialized = False
         
@@ -51,6 +68,10 @@ class RecordingIndicator:
                 pulse_phase = objc.ivar('pulse_phase', objc._C_FLT)
                 is_processing = objc.ivar('is_processing', objc._C_BOOL)
                 
+                # Processing text indexed by dot count (0 shows the full ellipsis)
+                _dot_texts = tuple(NSString.stringWithString_(s) for s in ("...", ".", "..", "..."))
+                _rec_text = NSString.stringWithString_("REC")
+                
                 def initWithFrame_(self, frame):
                     self = objc.super(PolishedIndicatorView, self).initWithFrame_(frame)
                     if self:
@@ -129,12 +150,10 @@ class RecordingIndicator:
                     # Text: "REC" when recording, "..." animated when processing
                     if self.is_processing:
                         # Animated dots based on phase
-                        import math
                         num_dots = int((self.pulse_phase * 2) % 4)  # 0, 1, 2, or 3 dots
-                        text = "." * max(1, num_dots) if num_dots > 0 else "..."
-                        text = "..." if num_dots == 0 else "." * num_dots
+                        ns_text = self._dot_texts[num_dots]
                     else:
-                        text = "REC"
+                        ns_text = self._rec_text
                     
                     font = NSFont.boldSystemFontOfSize_(11)
                     text_color = NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.9)
@@ -144,7 +163,6 @@ class RecordingIndicator:
                         NSForegroundColorAttributeName: text_color
                     }
                     
-                    ns_text = NSString.stringWithString_(text)
                     text_size = ns_text.sizeWithAttributes_(attrs)
                     text_x = 32
                     text_y = (h - text_size.height) / 2
@@ -261,23 +279,24 @@ class RecordingIndicator:
     def update_level(self, level: float):
         """Update the audio level (0.0 to 1.0)."""
         # Amplify level 10x for better responsiveness
-        self.current_level = min(1.0, max(0.0, level * 10))
+        self._level[0] = min(1.0, max(0.0, level * 10))
+    
+    def _tick(self):
+        """Push the latest level and phase to the view (runs on main thread)."""
+        if self.view:
+            self.view.level = self._level[0]
+            self.view.pulse_phase = self._phase
+            self.view.setNeedsDisplay_(True)
     
     def _start_animation(self):
         """Start the animation loop for smooth pulsing."""
         def animate():
             import time
-            phase = 0.0
+            self._phase = 0.0
+            tick = self._tick
             while self.is_visible:
-                phase += 0.15
-                
-                def _update(p=phase, l=self.current_level):
-                    if self.view:
-                        self.view.level = l
-                        self.view.pulse_phase = p
-                        self.view.setNeedsDisplay_(True)
-                
-                self._run_on_main(_update)
+                self._phase += 0.15
+                self._run_on_main(tick)
                 time.sleep(0.033)  # ~30 FPS
         
         self._update_thread = threading.Thread(target=animate, daemon=True)
@@ -285,18 +304,18 @@ class RecordingIndicator:
     
     def _run_on_main(self, func):
         """Run function on main thread."""
-        try:
-            from PyObjCTools import AppHelper
-            AppHelper.callAfter(func)
-        except:
+        if _main_runner is None:
             func()
+            return
+        _main_runner.performSelectorOnMainThread_withObject_waitUntilDone_(b"run:", func, False)
+
+
+# Singleton indicator - the NSWindow itself is still created lazily on first show
+_indicator: RecordingIndicator = RecordingIndicator()
 
 
 def get_indicator() -> RecordingIndicator:
-    """Get or create the singleton indicator."""
-    global _indicator
-    if _indicator is None:
-        _indicator = RecordingIndicator()
+    """Get the singleton indicator."""
     return _indicator
 
 
@@ -312,7 +331,7 @@ def hide_indicator():
 
 def update_indicator_level(level: float):
     """Update the audio level on the indicator."""
-    get_indicator().update_level(level)
+    _indicator.update_level(level)
 
 
 def set_processing_mode(processing: bool):
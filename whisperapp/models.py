@@ -3,6 +3,7 @@ Model registry and management for WhisperApp.
 Supports multiple STT models with download tracking.
 """
 import os
+import time
 import logging
 from pathlib import Path
 from typing import Dict, Optional, Callable
@@ -69,6 +70,12 @@ AVAILABLE_MODELS: Dict[str, ModelInfo] = {
 # Default model
 DEFAULT_MODEL = "parakeet"
 
+# Cached download status per model key. Refreshed after a short TTL so
+# downloads made outside the app show up, and cleared when a download completes.
+DOWNLOAD_STATUS_TTL = 2.0  # seconds
+_download_status: Optional[Dict[str, bool]] = None
+_download_status_time = 0.0
+
 
 def get_model_info(model_key: str) -> Optional[ModelInfo]:
     """Get info for a specific model."""
@@ -102,6 +109,16 @@ def is_model_downloaded(model_key: str) -> bool:
     return False
 
 
+def get_download_status() -> Dict[str, bool]:
+    """Get downloaded status for every model, cached for DOWNLOAD_STATUS_TTL seconds."""
+    global _download_status, _download_status_time
+    now = time.monotonic()
+    if _download_status is None or now - _download_status_time > DOWNLOAD_STATUS_TTL:
+        _download_status = {key: is_model_downloaded(key) for key in AVAILABLE_MODELS}
+        _download_status_time = now
+    return _download_status
+
+
 def download_model(model_key: str, progress_callback: Optional[Callable[[str], None]] = None) -> bool:
     """
     Download a model if not already present.
@@ -113,6 +130,7 @@ def download_model(model_key: str, progress_callback: Optional[Callable[[str], N
     Returns:
         True if successful, False otherwise
     """
+    global _download_status
     model = AVAILABLE_MODELS.get(model_key)
     if not model:
         log.error(f"Unknown model: {model_key}")
@@ -137,6 +155,7 @@ def download_model(model_key: str, progress_callback: Optional[Callable[[str], N
             mlx_whisper.transcribe("", path_or_hf_repo=model.model_id)
         
         log.info(f"✓ Model downloaded: {model.name}")
+        _download_status = None
         return True
         
     except Exception as e:
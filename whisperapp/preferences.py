@@ -2,13 +2,363 @@
 Preferences window for WhisperApp.
 Modern macOS UI with vibrancy effects and native styling.
 """
+import functools
 import logging
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
+import objc
+from AppKit import (
+    NSAlert,
+    NSAlertFirstButtonReturn,
+    NSApplication,
+    NSAttributedString,
+    NSBackingStoreBuffered,
+    NSBezelStyleRounded,
+    NSBezierPath,
+    NSBitmapImageRep,
+    NSButton,
+    NSColor,
+    NSCompositingOperationSourceOver,
+    NSDeviceRGBColorSpace,
+    NSFont,
+    NSFontAttributeName,
+    NSForegroundColorAttributeName,
+    NSGraphicsContext,
+    NSImage,
+    NSImageInterpolationHigh,
+    NSImageView,
+    NSInsetRect,
+    NSMutableAttributedString,
+    NSMutableParagraphStyle,
+    NSObject,
+    NSOffState,
+    NSOnState,
+    NSParagraphStyleAttributeName,
+    NSPopUpButton,
+    NSScreen,
+    NSTextField,
+    NSTextTab,
+    NSView,
+    NSVisualEffectBlendingModeBehindWindow,
+    NSVisualEffectMaterialHUDWindow,
+    NSVisualEffectStateActive,
+    NSVisualEffectView,
+    NSWindow,
+    NSWindowStyleMaskClosable,
+    NSWindowStyleMaskFullSizeContentView,
+    NSWindowStyleMaskTitled,
+    NSZeroRect,
+)
+
+# Cleanup toggle control: NSSwitch where AppKit has it (macOS 10.15+), else a checkbox
+try:
+    from AppKit import NSSwitch
+    _TOGGLE_CLS = NSSwitch
+    _TOGGLE_IS_SWITCH = True
+except ImportError:
+    _TOGGLE_CLS = NSButton
+    _TOGGLE_IS_SWITCH = False
+
+from .hotkey import HotkeyManager
+from .models import AVAILABLE_MODELS, get_download_status, is_model_downloaded
+
 log = logging.getLogger(__name__)
 
 _preferences_window = None
 
+# Type signature shared by the delegate's action methods: void return, one object argument
+_SIG_V_AT_AT = b'v@:@'
+
+# NSView subclass for settings cards, defined on first use
+_card_view_class = None
+
+# Target/action delegate class for the window's controls, defined on first use
+_delegate_class = None
+
+# Rows shown in the Keyboard Shortcuts card
+_SHORTCUTS = (
+    ("Hold hotkey", "Record & transcribe"),
+    ("Double-tap", "Paste last transcription"),
+    ("Triple-tap", "Undo (Cmd+Z)"),
+)
+
+
+@dataclass(frozen=True)
+class _Layout:
+    """Frames for every preferences view; the layout is fixed, so it is computed once at import."""
+    win_size: tuple
+    icon: tuple
+    title: tuple
+    version: tuple
+    model_card: tuple
+    model_label: tuple
+    model_popup: tuple
+    hotkey_card: tuple
+    hotkey_label: tuple
+    hotkey_button: tuple
+    format_card: tuple
+    format_label: tuple
+    format_switch: tuple
+    shortcuts_card: tuple
+    shortcuts_title: tuple
+    shortcuts_body: tuple
+    shortcuts_rows: tuple
+    footer: tuple
+
+
+def _compute_layout(win_width=400, win_height=480, card_margin=16, card_gap=10,
+                    row_card_height=58, shortcuts_card_height=100):
+    """Lay the window out top to bottom. Card children are in card coordinates."""
+    card_width = win_width - (card_margin * 2)
+    
+    # Single-row cards share a label baseline and control baseline
+    row_label_y = row_card_height - 38
+    row_control_y = row_card_height - 40
+    
+    y_pos = win_height - 45
+    icon = (((win_width - 56) / 2, y_pos - 20), (56, 56))
+    y_pos -= 70
+    title = ((0, y_pos), (win_width, 24))
+    y_pos -= 18
+    version = ((0, y_pos), (win_width, 16))
+    y_pos -= 25
+    
+    def next_card(height):
+        nonlocal y_pos
+        frame = ((card_margin, y_pos - height), (card_width, height))
+        y_pos -= height + card_gap
+        return frame
+    
+    model_card = next_card(row_card_height)
+    hotkey_card = next_card(row_card_height)
+    format_card = next_card(row_card_height)
+    shortcuts_card = next_card(shortcuts_card_height)
+    
+    rows_height = 20 * len(_SHORTCUTS)
+    return _Layout(
+        win_size=(win_width, win_height),
+        icon=icon,
+        title=title,
+        version=version,
+        model_card=model_card,
+        model_label=((14, row_label_y), (60, 18)),
+        model_popup=((80, row_control_y), (card_width - 100, 26)),
+        hotkey_card=hotkey_card,
+        hotkey_label=((14, row_label_y), (70, 18)),
+        hotkey_button=((90, row_control_y), (card_width - 110, 26)),
+        format_card=format_card,
+        format_label=((14, row_label_y), (140, 18)),
+        format_switch=((card_width - 60, row_control_y), (50, 26)),
+        shortcuts_card=shortcuts_card,
+        shortcuts_title=((14, shortcuts_card_height - 28), (200, 18)),
+        shortcuts_body=((0, 0), (card_width, shortcuts_card_height - 30)),
+        shortcuts_rows=((14, shortcuts_card_height - 32 - rows_height), (card_width - 28, rows_height)),
+        footer=((0, 20), (win_width, 14)),
+    )
+
+
+_LAYOUT = _compute_layout()
+
+# Fonts and colors, fetched once. Semantic NSColors resolve against the current
+# appearance at draw time, so they stay correct across light/dark switches.
+_palette = {}
+
+
+def _rasterize_icon(source, size):
+    """Draw source into a bitmap of exactly size points at the main screen's backing scale."""
+    screen = NSScreen.mainScreen()
+    scale = screen.backingScaleFactor() if screen else 2.0
+    pixels = int(size * scale)
+    
+    rep = NSBitmapImageRep.alloc().initWithBitmapDataPlanes_pixelsWide_pixelsHigh_bitsPerSample_samplesPerPixel_hasAlpha_isPlanar_colorSpaceName_bytesPerRow_bitsPerPixel_(
+        None, pixels, pixels, 8, 4, True, False, NSDeviceRGBColorSpace, 0, 0
+    )
+    rep.setSize_((size, size))
+    
+    NSGraphicsContext.saveGraphicsState()
+    context = NSGraphicsContext.graphicsContextWithBitmapImageRep_(rep)
+    context.setImageInterpolation_(NSImageInterpolationHigh)
+    NSGraphicsContext.setCurrentContext_(context)
+    source.drawInRect_fromRect_operation_fraction_(
+        ((0, 0), (size, size)), NSZeroRect, NSCompositingOperationSourceOver, 1.0
+    )
+    NSGraphicsContext.restoreGraphicsState()
+    
+    image = NSImage.alloc().initWithSize_((size, size))
+    image.addRepresentation_(rep)
+    return image
+
+
+@functools.lru_cache(maxsize=1)
+def _read_app_icon_data():
+    """Return the raw AppIcon.png bytes, or None if the asset is missing. Safe off the main thread."""
+    icon_path = Path(__file__).parent / "assets" / "AppIcon.png"
+    try:
+        return icon_path.read_bytes()
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_app_icon():
+    """Return the app icon NSImage, decoded and rasterized to 56pt once per process."""
+    data = _read_app_icon_data()
+    if not data:
+        return None
+    source = NSImage.alloc().initWithData_(data)
+    if not source:
+        return None
+    image = _rasterize_icon(source, 56)
+    image.setName_("WhisperAppIcon")  # Also reachable via NSImage.imageNamed_
+    return image
+
+
+def _get_palette():
+    """Return the shared fonts and colors, fetching them on first use."""
+    if not _palette:
+        _palette.update(
+            title_font=NSFont.boldSystemFontOfSize_(18),
+            heading_font=NSFont.boldSystemFontOfSize_(12),
+            body_font=NSFont.systemFontOfSize_(13),
+            small_font=NSFont.systemFontOfSize_(11),
+            footer_font=NSFont.systemFontOfSize_(10),
+            mono_font=NSFont.monospacedSystemFontOfSize_weight_(11, 0.4),
+            label=NSColor.labelColor(),
+            secondary=NSColor.secondaryLabelColor(),
+            tertiary=NSColor.tertiaryLabelColor(),
+            card_background=NSColor.controlBackgroundColor(),
+            separator=NSColor.separatorColor(),
+        )
+    return _palette
+
+
+def _get_card_view_class():
+    """Return the card view class, defining it on first use."""
+    global _card_view_class
+    if _card_view_class is None:
+        palette = _get_palette()
+        
+        class PreferencesCardView(NSView):
+            """Rounded card drawn with a bezier path instead of a CALayer border."""
+            
+            def drawRect_(self, rect):
+                bounds = NSInsetRect(self.bounds(), 0.25, 0.25)
+                path = NSBezierPath.bezierPathWithRoundedRect_xRadius_yRadius_(bounds, 10, 10)
+                palette['card_background'].setFill()
+                path.fill()
+                path.setLineWidth_(0.5)
+                palette['separator'].setStroke()
+                path.stroke()
+        
+        _card_view_class = PreferencesCardView
+    return _card_view_class
+
+
+def _get_delegate_class():
+    """Return the preferences delegate class, defining it on first use."""
+    global _delegate_class
+    if _delegate_class is None:
+        
+        class PreferencesDelegate(NSObject):
+            """Receives actions from the preferences controls."""
+            
+            # Action selectors, wired to the controls with setAction_
+            _SEL_MODEL = "modelChanged:"
+            _SEL_HOTKEY = "recordHotkey:"
+            _SEL_CLEANUP = "toggleCleanup:"
+            
+            @objc.typedSelector(_SIG_V_AT_AT)
+            def modelChanged_(self, sender):
+                prefs = self.prefs_window
+                index = sender.indexOfSelectedItem()
+                if not 0 <= index < len(prefs._index_to_key):
+                    return
+                model_key = prefs._index_to_key[index]
+                if model_key == prefs.app.current_model:
+                    return
+                if is_model_downloaded(model_key):
+                    prefs.app.select_model(model_key)
+                    return
+                
+                # Ask in a sheet so the run loop keeps going while the user decides
+                model_info = AVAILABLE_MODELS[model_key]
+                alert = NSAlert.alloc().init()
+                alert.setMessageText_(f"Download {model_info.name}?")
+                alert.setInformativeText_(f"Size: {model_info.size}\n\nThis will download the model for offline use.")
+                alert.addButtonWithTitle_("Download")
+                alert.addButtonWithTitle_("Cancel")
+                alert.beginSheetModalForWindow_completionHandler_(
+                    prefs.window, lambda response: self._handle_download_choice(response, model_key)
+                )
+            
+            @objc.python_method
+            def _handle_download_choice(self, response, model_key):
+                prefs = self.prefs_window
+                if response == NSAlertFirstButtonReturn:
+                    prefs.app.download_and_select(model_key)
+                else:
+                    # Declined download - put the selection back
+                    prefs.reset_selection()
+            
+            @objc.typedSelector(_SIG_V_AT_AT)
+            def recordHotkey_(self, sender):
+                prefs = self.prefs_window
+                if prefs.is_recording_hotkey:
+                    return
+                prefs.is_recording_hotkey = True
+                sender.setTitle_("Press a key...")
+                
+                if prefs.app.hotkey_manager:
+                    prefs.app.hotkey_manager.start_hotkey_recording(self._on_key_recorded)
+            
+            @objc.python_method
+            def _on_key_recorded(self, key_name):
+                prefs = self.prefs_window
+                display = HotkeyManager.KEY_DISPLAY.get(key_name, key_name)
+                prefs.hotkey_button.setTitle_(display)
+                prefs.is_recording_hotkey = False
+            
+            @objc.typedSelector(_SIG_V_AT_AT)
+            def toggleCleanup_(self, sender):
+                self.prefs_window.app.set_cleanup_enabled(sender.state() == NSOnState)
+            
+            @objc.typedSelector(_SIG_V_AT_AT)
+            def windowWillClose_(self, notification):
+                # The window is kept for the next show; only drop in-flight state
+                prefs = self.prefs_window
+                if prefs.is_recording_hotkey:
+                    if prefs.app.hotkey_manager:
+                        prefs.app.hotkey_manager.stop_hotkey_recording()
+                        prefs.hotkey_button.setTitle_(prefs.app.hotkey_manager.get_trigger_key_display())
+                    prefs.is_recording_hotkey = False
+        
+        _delegate_class = PreferencesDelegate
+    return _delegate_class
+
+
+def _make_label(frame, text, *, font=None, color=None, align=0):
+    """Create a non-editable, borderless text label (body font and label color by default)."""
+    palette = _get_palette()
+    label = NSTextField.alloc().initWithFrame_(frame)
+    # One KVC message instead of a bridge call per setter
+    label.setValuesForKeysWithDictionary_({
+        "stringValue": text,
+        "font": font or palette['body_font'],
+        "textColor": color or palette['label'],
+        "bezeled": False,
+        "drawsBackground": False,
+        "editable": False,
+        "alignment": align,
+    })
+    return label
+
+
+def _model_title(key, downloaded):
+    """Model popup title: a checkmark if the model is downloaded, a download arrow if not."""
+    return f"{'✓ ' if downloaded else '↓ '}{AVAILABLE_MODELS[key].name}"
+
 
 class PreferencesWindow:
     """Native macOS preferences window with modern vibrancy effects."""
@@ -17,36 +367,80 @@ class PreferencesWindow:
         self.app = app_instance
         self.window = None
         self.hotkey_button = None
+        self.model_popup = None
+        self.cleanup_btn = None
+        self.delegate = None
+        self._index_to_key = []  # Model popup index -> model key
+        self._titles = []  # Model popup index -> item title
+        self._model_index = {}  # Model key -> model popup index
         self.is_recording_hotkey = False
+        self._state = None
+        self._build_shortcuts = None  # Deferred until the window is first revealed
     
     def show(self):
-        """Show the preferences window."""
+        """Show the preferences window, building it only on first use."""
         try:
-            self._create_window()
+            if self.window is None:
+                self._create_window()
+            else:
+                self._sync_state()
+            if self._build_shortcuts:
+                self._build_shortcuts()
+                self._build_shortcuts = None
+            self.window.makeKeyAndOrderFront_(None)
+            NSApplication.sharedApplication().activateIgnoringOtherApps_(True)
+            log.info("Preferences window opened")
         except Exception as e:
             log.error(f"Failed to show preferences: {e}")
             import traceback
             traceback.print_exc()
     
+    def prepare(self):
+        """Build the window without showing it, so the first show only has to order it front."""
+        if self.window is not None:
+            return
+        try:
+            self._create_window()
+        except Exception as e:
+            log.warning(f"Could not pre-build preferences: {e}")
+    
+    def _state_key(self):
+        """App state the window's controls reflect."""
+        trigger_key = self.app.hotkey_manager.trigger_key_name if self.app.hotkey_manager else None
+        return (self.app.current_model, self.app.cleanup_enabled, trigger_key)
+    
+    def _sync_state(self):
+        """Refresh controls whose backing app state changed since the last show."""
+        # Pick up models downloaded outside the app; the status is TTL-cached
+        downloaded = get_download_status()
+        for index, key in enumerate(self._index_to_key):
+            title = _model_title(key, downloaded[key])
+            if self._titles[index] != title:
+                self._titles[index] = title
+                self.model_popup.itemAtIndex_(index).setTitle_(title)
+        
+        state = self._state_key()
+        if state == self._state:
+            return
+        
+        current_model, cleanup_enabled, _ = state
+        if current_model in AVAILABLE_MODELS:
+            self.model_popup.selectItemAtIndex_(self._model_index[current_model])
+        self.cleanup_btn.setState_(NSOnState if cleanup_enabled else NSOffState)
+        if self.app.hotkey_manager and not self.is_recording_hotkey:
+            self.hotkey_button.setTitle_(self.app.hotkey_manager.get_trigger_key_display())
+        
+        self._state = state
+    
     def _create_window(self):
         """Create the native preferences window with modern styling."""
-        from AppKit import (
-            NSWindow, NSWindowStyleMaskTitled, NSWindowStyleMaskClosable,
-            NSWindowStyleMaskFullSizeContentView, NSBackingStoreBuffered,
-            NSScreen, NSView, NSMakeRect, NSTextField, NSButton, 
-            NSPopUpButton, NSFont, NSColor, NSApp, NSBox,
-            NSImage, NSImageView, NSOnState, NSOffState,
-            NSVisualEffectView, NSVisualEffectBlendingModeBehindWindow,
-            NSVisualEffectMaterialHUDWindow, NSVisualEffectStateActive,
-            NSBezelStyleRounded
-        )
-        import objc
+        L = _LAYOUT
         
-        # Window dimensions
-        win_width = 400
-        win_height = 480
+        self.delegate = _get_delegate_class().alloc().init()
+        self.delegate.prefs_window = self
         
         # Center on screen
+        win_width, win_height = L.win_size
         screen = NSScreen.mainScreen()
         screen_frame = screen.frame()
         x = (screen_frame.size.width - win_width) / 2
@@ -67,244 +461,212 @@ class PreferencesWindow:
             NSBackingStoreBuffered,
             False
         )
+        self.window.setReleasedWhenClosed_(False)  # Reused on the next show
+        self.window.setDelegate_(self.delegate)
         self.window.setTitle_("Settings")
         self.window.setTitlebarAppearsTransparent_(True)
         self.window.setTitleVisibility_(1)  # Hidden
         
         # Vibrancy background
-        vibrancy_view = NSVisualEffectView.alloc().initWithFrame_(((0, 0), (win_width, win_height)))
+        vibrancy_view = NSVisualEffectView.alloc().initWithFrame_(((0, 0), L.win_size))
         vibrancy_view.setMaterial_(NSVisualEffectMaterialHUDWindow)
         vibrancy_view.setBlendingMode_(NSVisualEffectBlendingModeBehindWindow)
         vibrancy_view.setState_(NSVisualEffectStateActive)
+        vibrancy_children = []
         
-        y_pos = win_height - 45
+        palette = _get_palette()
         
         # === App Header with Icon ===
-        assets_dir = Path(__file__).parent / "assets"
-        icon_path = assets_dir / "AppIcon.png"
-        
-        if icon_path.exists():
-            image = NSImage.alloc().initWithContentsOfFile_(str(icon_path))
-            if image:
-                image.setSize_((56, 56))
-                image_view = NSImageView.alloc().initWithFrame_(NSMakeRect((win_width - 56) / 2, y_pos - 20, 56, 56))
-                image_view.setImage_(image)
-                vibrancy_view.addSubview_(image_view)
-        
-        y_pos -= 70
+        image = _get_app_icon()
+        if image:
+            image_view = NSImageView.alloc().initWithFrame_(L.icon)
+            image_view.setImage_(image)
+            vibrancy_children.append(image_view)
         
         # App name - centered
-        title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(0, y_pos, win_width, 24))
-        title_label.setStringValue_("WhisperApp")
-        title_label.setFont_(NSFont.boldSystemFontOfSize_(18))
-        title_label.setTextColor_(NSColor.labelColor())
-        title_label.setBezeled_(False)
-        title_label.setDrawsBackground_(False)
-        title_label.setEditable_(False)
-        title_label.setAlignment_(1)  # Center
-        vibrancy_view.addSubview_(title_label)
-        
-        y_pos -= 18
+        title_label = _make_label(L.title, "WhisperApp", font=palette['title_font'], align=1)
+        vibrancy_children.append(title_label)
         
         # Version - centered
-        version_label = NSTextField.alloc().initWithFrame_(NSMakeRect(0, y_pos, win_width, 16))
-        version_label.setStringValue_("Version 1.0.0")
-        version_label.setFont_(NSFont.systemFontOfSize_(11))
-        version_label.setTextColor_(NSColor.tertiaryLabelColor())
-        version_label.setBezeled_(False)
-        version_label.setDrawsBackground_(False)
-        version_label.setEditable_(False)
-        version_label.setAlignment_(1)  # Center
-        vibrancy_view.addSubview_(version_label)
-        
-        y_pos -= 25
+        version_label = _make_label(L.version, "Version 1.0.0", font=palette['small_font'], color=palette['tertiary'], align=1)
+        vibrancy_children.append(version_label)
         
         # === Settings Cards ===
-        card_margin = 16
-        card_width = win_width - (card_margin * 2)
         
         # --- Model Card ---
-        model_card_height = 58
-        model_card = self._create_card(card_margin, y_pos - model_card_height, card_width, model_card_height)
+        model_children = []
+        model_card = self._create_card(L.model_card)
         
-        model_label = NSTextField.alloc().initWithFrame_(NSMakeRect(14, model_card_height - 38, 60, 18))
-        model_label.setStringValue_("Model")
-        model_label.setFont_(NSFont.systemFontOfSize_(13))
-        model_label.setTextColor_(NSColor.labelColor())
-        model_label.setBezeled_(False)
-        model_label.setDrawsBackground_(False)
-        model_label.setEditable_(False)
-        model_card.addSubview_(model_label)
+        model_label = _make_label(L.model_label, "Model")
+        model_children.append(model_label)
         
-        from .models import AVAILABLE_MODELS, is_model_downloaded
-        
-        model_popup = NSPopUpButton.alloc().initWithFrame_(NSMakeRect(80, model_card_height - 40, card_width - 100, 26))
+        model_popup = NSPopUpButton.alloc().initWithFrame_(L.model_popup)
         model_popup.removeAllItems()
         
-        for key, info in AVAILABLE_MODELS.items():
-            downloaded = is_model_downloaded(key)
-            prefix = "✓ " if downloaded else "↓ "
-            model_popup.addItemWithTitle_(f"{prefix}{info.name}")
-            if key == self.app.current_model:
-                model_popup.selectItemWithTitle_(f"{prefix}{info.name}")
-        
-        model_card.addSubview_(model_popup)
-        vibrancy_view.addSubview_(model_card)
-        
-        y_pos -= model_card_height + 10
+        downloaded = get_download_status()
+        for i, key in enumerate(AVAILABLE_MODELS):
+            title = _model_title(key, downloaded[key])
+            self._index_to_key.append(key)
+            self._titles.append(title)
+            self._model_index[key] = i
+        model_popup.addItemsWithTitles_(self._titles)
+        if self.app.current_model in self._model_index:
+            model_popup.selectItemAtIndex_(self._model_index[self.app.current_model])
+        
+        model_popup.setTarget_(self.delegate)
+        model_popup.setAction_(self.delegate._SEL_MODEL)
+        model_children.append(model_popup)
+        self.model_popup = model_popup
+        model_card.setSubviews_(model_children)
+        vibrancy_children.append(model_card)
         
         # --- Hotkey Card ---
-        hotkey_card_height = 58
-        hotkey_card = self._create_card(card_margin, y_pos - hotkey_card_height, card_width, hotkey_card_height)
+        hotkey_children = []
+        hotkey_card = self._create_card(L.hotkey_card)
         
-        hotkey_label = NSTextField.alloc().initWithFrame_(NSMakeRect(14, hotkey_card_height - 38, 70, 18))
-        hotkey_label.setStringValue_("Hotkey")
-        hotkey_label.setFont_(NSFont.systemFontOfSize_(13))
-        hotkey_label.setTextColor_(NSColor.labelColor())
-        hotkey_label.setBezeled_(False)
-        hotkey_label.setDrawsBackground_(False)
-        hotkey_label.setEditable_(False)
-        hotkey_card.addSubview_(hotkey_label)
-        
-        from .hotkey import HotkeyManager
+        hotkey_label = _make_label(L.hotkey_label, "Hotkey")
+        hotkey_children.append(hotkey_label)
         
         # Get current hotkey display
         current_display = self.app.hotkey_manager.get_trigger_key_display() if self.app.hotkey_manager else "Right ⌘"
         
         # Record Hotkey button
-        self.hotkey_button = NSButton.alloc().initWithFrame_(NSMakeRect(90, hotkey_card_height - 40, card_width - 110, 26))
+        self.hotkey_button = NSButton.alloc().initWithFrame_(L.hotkey_button)
         self.hotkey_button.setTitle_(current_display)
         self.hotkey_button.setBezelStyle_(NSBezelStyleRounded)
         
-        def on_record_hotkey(sender):
-            if not self.is_recording_hotkey:
-                self.is_recording_hotkey = True
-                sender.setTitle_("Press a key...")
-                
-                def on_key_recorded(key_name):
-                    display = HotkeyManager.KEY_DISPLAY.get(key_name, key_name)
-                    sender.setTitle_(display)
-                    self.is_recording_hotkey = False
-                
-                if self.app.hotkey_manager:
-                    self.app.hotkey_manager.start_hotkey_recording(on_key_recorded)
-        
-        self.hotkey_button.setTarget_(self.hotkey_button)
-        self.hotkey_button.setAction_(objc.selector(on_record_hotkey, signature=b'v@:@'))
-        hotkey_card.addSubview_(self.hotkey_button)
-        vibrancy_view.addSubview_(hotkey_card)
-        
-        y_pos -= hotkey_card_height + 10
+        self.hotkey_button.setTarget_(self.delegate)
+        self.hotkey_button.setAction_(self.delegate._SEL_HOTKEY)
+        hotkey_children.append(self.hotkey_button)
+        hotkey_card.setSubviews_(hotkey_children)
+        vibrancy_children.append(hotkey_card)
         
         # --- Formatting Card ---
-        format_card_height = 58
-        format_card = self._create_card(card_margin, y_pos - format_card_height, card_width, format_card_height)
-        
-        format_label = NSTextField.alloc().initWithFrame_(NSMakeRect(14, format_card_height - 38, 140, 18))
-        format_label.setStringValue_("AI Formatting")
-        format_label.setFont_(NSFont.systemFontOfSize_(13))
-        format_label.setTextColor_(NSColor.labelColor())
-        format_label.setBezeled_(False)
-        format_label.setDrawsBackground_(False)
-        format_label.setEditable_(False)
-        format_card.addSubview_(format_label)
-        
-        cleanup_btn = NSButton.alloc().initWithFrame_(NSMakeRect(card_width - 60, format_card_height - 40, 50, 26))
-        cleanup_btn.setButtonType_(13)  # Switch style
-        cleanup_btn.setTitle_("")
-        cleanup_btn.setState_(NSOnState if self.app.cleanup_enabled else NSOffState)
-        
-        def toggle_cleanup(sender):
-            self.app.cleanup_enabled = (sender.state() == NSOnState)
+        format_children = []
+        format_card = self._create_card(L.format_card)
         
-        cleanup_btn.setTarget_(cleanup_btn)
-        cleanup_btn.setAction_(objc.selector(toggle_cleanup, signature=b'v@:@'))
-        format_card.addSubview_(cleanup_btn)
-        vibrancy_view.addSubview_(format_card)
+        format_label = _make_label(L.format_label, "AI Formatting")
+        format_children.append(format_label)
         
-        y_pos -= format_card_height + 10
+        cleanup_btn = _TOGGLE_CLS.alloc().initWithFrame_(L.format_switch)
+        if not _TOGGLE_IS_SWITCH:
+            cleanup_btn.setButtonType_(3)  # NSButtonTypeSwitch (checkbox)
+            cleanup_btn.setTitle_("")
+        cleanup_btn.setState_(NSOnState if self.app.cleanup_enabled else NSOffState)
+        cleanup_btn.setTarget_(self.delegate)
+        cleanup_btn.setAction_(self.delegate._SEL_CLEANUP)
+        format_children.append(cleanup_btn)
+        self.cleanup_btn = cleanup_btn
+        format_card.setSubviews_(format_children)
+        vibrancy_children.append(format_card)
         
         # --- Shortcuts Info Card ---
-        shortcuts_card_height = 100
-        shortcuts_card = self._create_card(card_margin, y_pos - shortcuts_card_height, card_width, shortcuts_card_height)
-        
-        shortcuts_title = NSTextField.alloc().initWithFrame_(NSMakeRect(14, shortcuts_card_height - 28, 200, 18))
-        shortcuts_title.setStringValue_("Keyboard Shortcuts")
-        shortcuts_title.setFont_(NSFont.boldSystemFontOfSize_(12))
-        shortcuts_title.setTextColor_(NSColor.secondaryLabelColor())
-        shortcuts_title.setBezeled_(False)
-        shortcuts_title.setDrawsBackground_(False)
-        shortcuts_title.setEditable_(False)
-        shortcuts_card.addSubview_(shortcuts_title)
-        
-        shortcuts_info = [
-            ("Hold hotkey", "Record & transcribe"),
-            ("Double-tap", "Paste last transcription"),
-            ("Triple-tap", "Undo (Cmd+Z)"),
-        ]
-        
-        row_y = shortcuts_card_height - 48
-        for action, desc in shortcuts_info:
-            action_label = NSTextField.alloc().initWithFrame_(NSMakeRect(14, row_y, 90, 16))
-            action_label.setStringValue_(action)
-            action_label.setFont_(NSFont.monospacedSystemFontOfSize_weight_(11, 0.4))
-            action_label.setTextColor_(NSColor.labelColor())
-            action_label.setBezeled_(False)
-            action_label.setDrawsBackground_(False)
-            action_label.setEditable_(False)
-            shortcuts_card.addSubview_(action_label)
+        shortcuts_children = []
+        shortcuts_card = self._create_card(L.shortcuts_card)
+        
+        shortcuts_title = _make_label(L.shortcuts_title, "Keyboard Shortcuts", font=palette['heading_font'], color=palette['secondary'])
+        shortcuts_children.append(shortcuts_title)
+        
+        # Rows live in a placeholder body that is filled on first reveal
+        shortcuts_body = NSView.alloc().initWithFrame_(L.shortcuts_body)
+        shortcuts_children.append(shortcuts_body)
+        
+        def build_shortcuts():
+            # One attributed string with a tab stop lining the descriptions up in a
+            # second column (x=110 in card coordinates), 20pt per row
+            style = NSMutableParagraphStyle.alloc().init()
+            style.setTabStops_([NSTextTab.alloc().initWithTextAlignment_location_options_(0, 96, {})])
+            style.setMinimumLineHeight_(20)
+            style.setMaximumLineHeight_(20)
+            action_attrs = {
+                NSFontAttributeName: palette['mono_font'],
+                NSForegroundColorAttributeName: palette['label'],
+                NSParagraphStyleAttributeName: style,
+            }
+            desc_attrs = {
+                NSFontAttributeName: palette['small_font'],
+                NSForegroundColorAttributeName: palette['secondary'],
+                NSParagraphStyleAttributeName: style,
+            }
             
-            desc_label = NSTextField.alloc().initWithFrame_(NSMakeRect(110, row_y, card_width - 130, 16))
-            desc_label.setStringValue_(desc)
-            desc_label.setFont_(NSFont.systemFontOfSize_(11))
-            desc_label.setTextColor_(NSColor.secondaryLabelColor())
-            desc_label.setBezeled_(False)
-            desc_label.setDrawsBackground_(False)
-            desc_label.setEditable_(False)
-            shortcuts_card.addSubview_(desc_label)
+            text = NSMutableAttributedString.alloc().init()
+            for i, (action, desc) in enumerate(_SHORTCUTS):
+                prefix = "\n" if i else ""
+                text.appendAttributedString_(NSAttributedString.alloc().initWithString_attributes_(f"{prefix}{action}\t", action_attrs))
+                text.appendAttributedString_(NSAttributedString.alloc().initWithString_attributes_(desc, desc_attrs))
             
-            row_y -= 20
+            rows_label = _make_label(L.shortcuts_rows, "", font=palette['small_font'], color=palette['secondary'])
+            rows_label.setUsesSingleLineMode_(False)
+            rows_label.setAllowsEditingTextAttributes_(False)
+            rows_label.setAttributedStringValue_(text)
+            shortcuts_body.setSubviews_([rows_label])
         
-        vibrancy_view.addSubview_(shortcuts_card)
+        self._build_shortcuts = build_shortcuts
         
-        y_pos -= shortcuts_card_height + 10
+        shortcuts_card.setSubviews_(shortcuts_children)
+        vibrancy_children.append(shortcuts_card)
         
         # === Footer ===
-        footer_label = NSTextField.alloc().initWithFrame_(NSMakeRect(0, 20, win_width, 14))
-        footer_label.setStringValue_("Local AI • No data leaves your Mac")
-        footer_label.setFont_(NSFont.systemFontOfSize_(10))
-        footer_label.setTextColor_(NSColor.tertiaryLabelColor())
-        footer_label.setBezeled_(False)
-        footer_label.setDrawsBackground_(False)
-        footer_label.setEditable_(False)
-        footer_label.setAlignment_(1)  # Center
-        vibrancy_view.addSubview_(footer_label)
+        footer_label = _make_label(L.footer, "Local AI • No data leaves your Mac", font=palette['footer_font'], color=palette['tertiary'], align=1)
+        vibrancy_children.append(footer_label)
         
+        vibrancy_view.setSubviews_(vibrancy_children)
         self.window.setContentView_(vibrancy_view)
-        self.window.makeKeyAndOrderFront_(None)
-        NSApp.activateIgnoringOtherApps_(True)
-        
-        log.info("Preferences window opened")
+        self._state = self._state_key()
     
-    def _create_card(self, x, y, width, height):
-        """Create a styled card view with vibrancy."""
-        from AppKit import NSVisualEffectView, NSVisualEffectStateActive, NSColor, NSMakeRect
-        
-        card = NSVisualEffectView.alloc().initWithFrame_(NSMakeRect(x, y, width, height))
-        card.setMaterial_(3)  # NSVisualEffectMaterialLight
-        card.setBlendingMode_(0)  # NSVisualEffectBlendingModeWithinWindow
-        card.setState_(NSVisualEffectStateActive)
-        card.setWantsLayer_(True)
-        card.layer().setCornerRadius_(10)
-        card.layer().setMasksToBounds_(True)
-        card.layer().setBorderWidth_(0.5)
-        card.layer().setBorderColor_(NSColor.separatorColor().CGColor())
-        
-        return card
+    def mark_downloaded(self, model_key):
+        """Flip a model's popup entry to the downloaded checkmark."""
+        index = self._model_index.get(model_key)
+        if self.model_popup is None or index is None:
+            return
+        title = _model_title(model_key, True)
+        if self._titles[index] != title:
+            self._titles[index] = title
+            self.model_popup.itemAtIndex_(index).setTitle_(title)
+    
+    def reset_selection(self):
+        """Point the model popup back at the app's current model."""
+        index = self._model_index.get(self.app.current_model)
+        if self.model_popup is not None and index is not None:
+            self.model_popup.selectItemAtIndex_(index)
+    
+    def _create_card(self, frame):
+        """Create a rounded card view that draws its own background and border."""
+        return _get_card_view_class().alloc().initWithFrame_(frame)
 
 
 def show_preferences(app_instance):
-    """Show the preferences window."""
+    """Show the preferences window, reusing the previously built one."""
     global _preferences_window
-    _preferences_window = PreferencesWindow(app_instance)
+    if _preferences_window is None or _preferences_window.app is not app_instance:
+        _preferences_window = PreferencesWindow(app_instance)
     _preferences_window.show()
+
+
+def mark_model_downloaded(model_key):
+    """Update the preferences model popup, if built, after a model finishes downloading."""
+    if _preferences_window is not None:
+        _preferences_window.mark_downloaded(model_key)
+
+
+def reset_model_selection():
+    """Revert the preferences model popup, if built, to the current model after a failed download."""
+    if _preferences_window is not None:
+        _preferences_window.reset_selection()
+
+
+def prewarm_preferences(app_instance):
+    """Build the preferences window ahead of the first open."""
+    global _preferences_window
+    if _preferences_window is not None:
+        return
+    prefs = _preferences_window = PreferencesWindow(app_instance)
+    
+    def warm():
+        # Only the disk-bound inputs are loaded here; views are built on the main thread
+        from PyObjCTools import AppHelper
+        get_download_status()
+        _read_app_icon_data()
+        AppHelper.callAfter(prefs.prepare)
+    
+    threading.Thread(target=warm, daemon=True).start()
@@ -1,14 +1,66 @@
 """Audio recording module for capturing microphone input."""
 
+import math
+import re
+import struct
 import tempfile
 import threading
 import time
 from typing import Optional, Callable
 
 import numpy as np
-from scipy.io import wavfile
 import sounddevice as sd
 
+# Virtual audio devices to avoid when picking a microphone
+_VIRTUAL_DEVICE_RE = re.compile(r'blackhole|soundflower|loopback|virtual', re.IGNORECASE)
+
+# Canonical 44-byte header for a 16-bit PCM WAV file
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def _rms(samples: np.ndarray) -> float:
+    """Root-mean-square level of a block, in one pass and without temporaries."""
+    flat = samples.ravel()
+    return math.sqrt(float(np.dot(flat, flat)) / flat.size)
+
+
+def _float_to_int16(audio: np.ndarray) -> np.ndarray:
+    """Convert float32 audio in [-1, 1] to int16, saturating (in place) rather than wrapping."""
+    np.clip(audio, -1.0, 1.0, out=audio)
+    audio_int16 = np.empty(audio.shape, dtype=np.int16)
+    np.multiply(audio, np.iinfo(np.int16).max, out=audio_int16, casting='unsafe')
+    return audio_int16
+
+
+def _write_wav(f, sample_rate: int, audio_int16: np.ndarray) -> None:
+    """Write 16-bit PCM samples (frames x channels) as a WAV file to an open binary file."""
+    channels = audio_int16.shape[1] if audio_int16.ndim > 1 else 1
+    data_size = audio_int16.nbytes
+    header = _WAV_HEADER.pack(
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+        b'data', data_size,
+    )
+    f.write(header)
+    f.write(memoryview(np.ascontiguousarray(audio_int16, dtype='<i2')).cast('B'))
+
+
+def write_temp_wav(audio: np.ndarray, sample_rate: int) -> str:
+    """
+    Save float32 audio in [-1, 1] to a temporary 16-bit WAV file.
+    
+    The samples are clipped in place before conversion.
+    
+    Returns:
+        Path to the saved WAV file
+    """
+    audio_int16 = _float_to_int16(audio)
+    
+    # Created and opened atomically, then written through one large buffer
+    with tempfile.NamedTemporaryFile(mode='wb', suffix=".wav", delete=False, buffering=1 << 20) as f:
+        _write_wav(f, sample_rate, audio_int16)
+    return f.name
+
 
 class AudioRecorder:
     """
@@ -26,16 +78,26 @@ class AudioRecorder:
         Initialize the audio recorder.
         
         Args:
-            sample_rate: Audio sample rate in Hz (16000 recommended for Whisper/Parakeet)
-            channels: Number of audio channels (1 for mono)
+            sample_rate: Output sample rate in Hz (16000 recommended for Whisper/Parakeet);
+                the device is captured at its native rate and resampled at stop
+            channels: Number of audio channels captured (1 for mono); recordings are
+                downmixed to mono as they arrive
         """
         self.sample_rate = sample_rate
         self.channels = channels
-        self.frames: list = []
+        # Mono recording buffer, sized for a minute of audio at the stream rate
+        # (resized once the device is known) and doubled when full
+        self._buf = np.empty(sample_rate * 60, dtype=np.float32)
+        self._write_pos = 0
         self.stream = None
-        self.recording = False
-        self._lock = threading.Lock()
-        self._start_time: Optional[float] = None
+        # Set while recording; the audio callback only reads it, so it never takes a lock
+        self._recording_event = threading.Event()
+        self._lock = threading.Lock()  # Serializes start/stop/cancel transitions
+        self._start_time = 0  # time.monotonic_ns() at start()
+        # Input device chosen by _find_real_microphone, looked up on first start()
+        self._device_index: Optional[int] = None
+        self._device_resolved = False
+        self._stream_rate = sample_rate  # Rate the stream captures at, the device's native one
         self.level_callback: Optional[callable] = None  # Callback for audio level
     
     def _audio_callback(self, indata, frames, time_info, status):
@@ -43,65 +105,106 @@ class AudioRecorder:
         if status:
             print(f"Audio status: {status}")
         
+        if not self._recording_event.is_set():
+            return
+        
+        # Single producer: only this thread advances _write_pos while recording
+        end = self._write_pos + len(indata)
+        if end > len(self._buf):
+            grown = np.empty(max(end, 2 * len(self._buf)), dtype=np.float32)
+            np.copyto(grown[:self._write_pos], self._buf[:self._write_pos])
+            self._buf = grown
+        if self.channels == 1:
+            np.copyto(self._buf[self._write_pos:end], indata[:, 0])
+        else:
+            np.mean(indata, axis=1, out=self._buf[self._write_pos:end])
+        self._write_pos = end
+        
+        # Calculate and emit audio level for visualizer
+        if self.level_callback:
+            self.level_callback(_rms(indata))
+    
+    def _resolve_device(self) -> None:
+        """Pick the input device and its native rate, once."""
         with self._lock:
-            if self.recording:
-                self.frames.append(indata.copy())
-                
-                # Calculate and emit audio level for visualizer
-                if self.level_callback:
-                    import numpy as np
-                    rms = np.sqrt(np.mean(indata**2))
-                    self.level_callback(rms)
+            if self._device_resolved:
+                return
+            # Find a real microphone (avoid virtual devices like BlackHole)
+            self._device_index = self._find_real_microphone()
+            self._stream_rate = int(sd.query_devices(self._device_index, 'input')['default_samplerate'])
+            self._device_resolved = True
+            # Keep a minute of headroom at the native rate so the callback doesn't have to grow it
+            if len(self._buf) < self._stream_rate * 60:
+                self._buf = np.empty(self._stream_rate * 60, dtype=np.float32)
+    
+    def prepare(self) -> None:
+        """
+        Resolve the input device and load the resampler ahead of the first recording.
+        
+        Blocks; call from a background thread so the first push-to-talk doesn't pay for it.
+        """
+        self._resolve_device()
+        if self._stream_rate != self.sample_rate:
+            import scipy.signal  # noqa: F401 - slow first import, cached for get_float32_array
     
     def start(self) -> None:
         """Start recording audio from the microphone."""
+        self._resolve_device()
         
-        # Clean up any existing stream first to prevent resource leaks
+        with self._lock:
+            self._write_pos = 0
+            self._start_time = time.monotonic_ns()
+            self._recording_event.set()
+        
+        try:
+            # The stream is opened once and only started/stopped per recording;
+            # opening it is what costs the Core Audio device negotiation
+            if self.stream is None:
+                self.stream = sd.InputStream(
+                    device=self._device_index,
+                    samplerate=self._stream_rate,
+                    channels=self.channels,
+                    dtype='float32',
+                    callback=self._audio_callback
+                )
+            if not self.stream.active:
+                self.stream.start()
+        except Exception as e:
+            self._recording_event.clear()
+            self.invalidate_device()  # The cached device may have gone away
+            raise
+    
+    def invalidate_device(self) -> None:
+        """Forget the cached input device and its stream so the next start() picks one again."""
+        self.close()
+        self._device_resolved = False
+        self._device_index = None
+    
+    def _pause_stream(self) -> None:
+        """Stop the stream between recordings, keeping it open for the next start()."""
         if self.stream:
             try:
                 self.stream.stop()
+            except Exception:
+                self.close()
+    
+    def close(self) -> None:
+        """Close the input stream; call on shutdown."""
+        if self.stream:
+            try:
                 self.stream.close()
-            except:
+            except Exception:
                 pass
             self.stream = None
-        
-        with self._lock:
-            self.frames = []
-            self.recording = True
-            self._start_time = time.time()
-        
-        # Find a real microphone (avoid virtual devices like BlackHole)
-        device = self._find_real_microphone()
-        
-        try:
-            self.stream = sd.InputStream(
-                device=device,
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype='float32',
-                callback=self._audio_callback
-            )
-            self.stream.start()
-        except Exception as e:
-            self.recording = False
-            self.stream = None
-            raise
     
     def _find_real_microphone(self):
         """Find a real microphone device, avoiding virtual audio devices."""
-        
-        # Virtual audio devices to avoid
-        virtual_devices = ['blackhole', 'soundflower', 'loopback', 'virtual']
-        
         devices = sd.query_devices()
         candidates = []
         
         for i, d in enumerate(devices):
-            if d['max_input_channels'] > 0:
-                name_lower = d['name'].lower()
-                is_virtual = any(v in name_lower for v in virtual_devices)
-                if not is_virtual:
-                    candidates.append((i, d['name']))
+            if d['max_input_channels'] > 0 and not _VIRTUAL_DEVICE_RE.search(d['name']):
+                candidates.append((i, d['name']))
         
         if candidates:
             # Prefer MacBook built-in mic for reliability
@@ -121,52 +224,58 @@ class AudioRecorder:
         Returns:
             Path to the saved WAV file
         """
+        self._finish()
+        return write_temp_wav(self.get_float32_array(), self.sample_rate)
+    
+    def stop_array(self) -> np.ndarray:
+        """
+        Stop recording and return the audio without writing it to disk.
         
+        Returns:
+            Mono float32 samples at sample_rate (see get_float32_array)
+        """
+        self._finish()
+        return self.get_float32_array()
+    
+    def get_float32_array(self) -> np.ndarray:
+        """
+        Mono float32 audio of the last recording at sample_rate, ready for the transcribers.
+        
+        When the device already runs at sample_rate this is a view of the recording
+        buffer, only valid until the next start().
+        """
+        audio = self._buf[:self._write_pos]
+        if self._stream_rate == self.sample_rate:
+            return audio
+        # Polyphase FIR resampling, cleaner than PortAudio's converter. Imported here
+        # so setups already at sample_rate never load scipy.signal; prepare() loads it
+        # ahead of time for the usual 44.1/48 kHz mics
+        from scipy.signal import resample_poly
+        g = math.gcd(self.sample_rate, self._stream_rate)
+        resampled = resample_poly(audio, self.sample_rate // g, self._stream_rate // g)
+        return resampled.astype(np.float32, copy=False)
+    
+    def _finish(self) -> None:
+        """Stop the stream and record the duration; raises if nothing was captured."""
         with self._lock:
-            self.recording = False
-            duration = time.time() - self._start_time if self._start_time else 0
+            self._recording_event.clear()
+            duration = (time.monotonic_ns() - self._start_time) * 1e-9
         
-        # Safely close stream
-        if self.stream:
-            try:
-                self.stream.stop()
-                self.stream.close()
-            except Exception:
-                pass
-            self.stream = None
+        self._pause_stream()
         
-        # Concatenate all recorded frames
-        if not self.frames:
+        if not self._write_pos:
             raise RuntimeError("No audio was recorded")
         
-        audio_data = np.concatenate(self.frames, axis=0)
-        
-        # Convert float32 to int16 for WAV file
-        audio_int16 = (audio_data * 32767).astype(np.int16)
-        
-        # Save to temporary WAV file
-        wav_path = tempfile.mktemp(suffix=".wav")
-        wavfile.write(wav_path, self.sample_rate, audio_int16)
-        
         # Store duration for statistics
         self._last_duration = duration
-        
-        return wav_path
     
     def cancel(self) -> None:
         """Cancel recording without saving - for quick taps."""
         with self._lock:
-            self.recording = False
-            self.frames = []
+            self._recording_event.clear()
+            self._write_pos = 0
         
-        # Safely close stream
-        if self.stream:
-            try:
-                self.stream.stop()
-                self.stream.close()
-            except Exception:
-                pass
-            self.stream = None
+        self._pause_stream()
     
     @property
     def last_duration(self) -> float:
@@ -176,13 +285,11 @@ class AudioRecorder:
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
-        return self.recording
+        return self._recording_event.is_set()
 
 
 def list_audio_devices():
     """List available audio input devices."""
-    import sounddevice as sd
-    
     devices = sd.query_devices()
     input_devices = []
     
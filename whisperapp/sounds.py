@@ -1,8 +1,13 @@
 """
 Audio feedback module for WhisperApp.
-Uses macOS native NSSound for instant, low-latency playback.
+Uses System Sound Services for instant, low-latency playback, with NSSound as a fallback.
 """
+import ctypes
+import ctypes.util
+import itertools
 import logging
+import subprocess
+import threading
 from pathlib import Path
 
 log = logging.getLogger(__name__)
@@ -11,15 +16,109 @@ log = logging.getLogger(__name__)
 ASSETS_DIR = Path(__file__).parent / "assets"
 DROP_SOUND = ASSETS_DIR / "drop.mp3"
 
-# Pre-loaded sounds for instant playback
-_start_sound = None
-_stop_sound = None
+# System Sound Services can't play MP3, so a decoded CAF copy is cached here
+DROP_SOUND_CAF = Path.home() / ".whisperapp" / "drop.caf"
+
+# Instances per sound. Presses play the next instance in turn, so an
+# overlapping press never has to stop() one that is still playing.
+SOUND_POOL_SIZE = 4
+
+# kAudioServicesPropertyIsUISound ('isui'). Cleared so the cue isn't muted by the
+# "Play user interface sound effects" setting or routed to the alert device.
+_PROPERTY_IS_UI_SOUND = 0x69737569
+
+# Registered system sound, played by AudioServicesPlaySystemSound once the
+# background registration finishes; until then the NSSound pool is used
+_audio_toolbox = None
+_system_sound_id = None
+
+# NSSound fallback: pre-loaded sounds for instant playback, cycled round-robin
+_start_sounds = None
+_stop_sounds = None
 _initialized = False
 
 
+def _decoded_drop_sound() -> Path:
+    """Return the CAF copy of DROP_SOUND, converting it with afconvert when missing or stale."""
+    if not DROP_SOUND_CAF.exists() or DROP_SOUND_CAF.stat().st_mtime < DROP_SOUND.stat().st_mtime:
+        DROP_SOUND_CAF.parent.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            ["afconvert", "-f", "caff", "-d", "LEI16", str(DROP_SOUND), str(DROP_SOUND_CAF)],
+            check=True, capture_output=True
+        )
+    return DROP_SOUND_CAF
+
+
+def _init_system_sound() -> bool:
+    """Register the drop sound with System Sound Services. Returns False if that isn't possible."""
+    global _audio_toolbox, _system_sound_id
+    
+    library = ctypes.util.find_library("AudioToolbox")
+    if not library:
+        return False
+    toolbox = ctypes.cdll.LoadLibrary(library)
+    toolbox.AudioServicesCreateSystemSoundID.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+    toolbox.AudioServicesCreateSystemSoundID.restype = ctypes.c_int32
+    toolbox.AudioServicesSetProperty.argtypes = [
+        ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p
+    ]
+    toolbox.AudioServicesSetProperty.restype = ctypes.c_int32
+    toolbox.AudioServicesDisposeSystemSoundID.argtypes = [ctypes.c_uint32]
+    toolbox.AudioServicesDisposeSystemSoundID.restype = ctypes.c_int32
+    toolbox.AudioServicesPlaySystemSound.argtypes = [ctypes.c_uint32]
+    toolbox.AudioServicesPlaySystemSound.restype = None
+    
+    import objc
+    from Foundation import NSURL
+    
+    # NSURL is toll-free bridged to the CFURLRef the call expects
+    url = NSURL.fileURLWithPath_(str(_decoded_drop_sound()))
+    sound_id = ctypes.c_uint32()
+    status = toolbox.AudioServicesCreateSystemSoundID(objc.pyobjc_id(url), ctypes.byref(sound_id))
+    if status != 0:
+        log.debug(f"AudioServicesCreateSystemSoundID failed: {status}")
+        return False
+    
+    zero = ctypes.c_uint32(0)
+    status = toolbox.AudioServicesSetProperty(
+        _PROPERTY_IS_UI_SOUND, ctypes.sizeof(sound_id), ctypes.byref(sound_id),
+        ctypes.sizeof(zero), ctypes.byref(zero)
+    )
+    if status != 0:
+        log.debug(f"Could not clear IsUISound: {status}")
+        toolbox.AudioServicesDisposeSystemSoundID(sound_id)
+        return False
+    
+    _audio_toolbox = toolbox
+    _system_sound_id = sound_id.value
+    return True
+
+
+def _load_pool():
+    """Load SOUND_POOL_SIZE instances of the drop sound, returning a round-robin iterator."""
+    from AppKit import NSSound
+    
+    sounds = [
+        NSSound.alloc().initWithContentsOfFile_byReference_(str(DROP_SOUND), True)
+        for _ in range(SOUND_POOL_SIZE)
+    ]
+    if not all(sounds):
+        return None
+    return itertools.cycle(sounds)
+
+
+def _prepare_system_sound():
+    """Convert and register the system sound; runs on a background thread."""
+    try:
+        if _init_system_sound():
+            log.debug("✓ Sound effects registered with System Sound Services")
+    except Exception as e:
+        log.debug(f"System sound unavailable, using NSSound: {e}")
+
+
 def _init_sounds():
     """Pre-load sounds for instant playback."""
-    global _start_sound, _stop_sound, _initialized
+    global _start_sounds, _stop_sounds, _initialized
     
     if _initialized:
         return
@@ -29,21 +128,18 @@ def _init_sounds():
         _initialized = True
         return
     
+    # afconvert can take a moment on first launch, so it stays off the import path
+    threading.Thread(target=_prepare_system_sound, daemon=True).start()
+    
     try:
-        from AppKit import NSSound
-        
-        # Load the sound once for instant playback
-        _start_sound = NSSound.alloc().initWithContentsOfFile_byReference_(
-            str(DROP_SOUND), True
-        )
+        # Load the sounds once for instant playback
+        _start_sounds = _load_pool()
         
         # For stop sound, we'll use same sound (pitch shift not easily done with NSSound)
         # But we can use a slightly different approach or just accept same sound
-        _stop_sound = NSSound.alloc().initWithContentsOfFile_byReference_(
-            str(DROP_SOUND), True
-        )
+        _stop_sounds = _load_pool()
         
-        if _start_sound and _stop_sound:
+        if _start_sounds and _stop_sounds:
             log.debug("✓ Sound effects loaded")
         
         _initialized = True
@@ -59,11 +155,11 @@ def _init_sounds():
 def play_start_sound():
     """Play the start recording sound (instant)."""
     _init_sounds()
-    if _start_sound:
+    if _system_sound_id is not None:
+        _audio_toolbox.AudioServicesPlaySystemSound(_system_sound_id)
+    elif _start_sounds:
         try:
-            # Stop if already playing, then play
-            _start_sound.stop()
-            _start_sound.play()
+            next(_start_sounds).play()
         except Exception as e:
             log.debug(f"Start sound error: {e}")
 
@@ -71,11 +167,11 @@ def play_start_sound():
 def play_stop_sound():
     """Play the stop recording sound (instant)."""
     _init_sounds()
-    if _stop_sound:
+    if _system_sound_id is not None:
+        _audio_toolbox.AudioServicesPlaySystemSound(_system_sound_id)
+    elif _stop_sounds:
         try:
-            # Stop if already playing, then play
-            _stop_sound.stop()
-            _stop_sound.play()
+            next(_stop_sounds).play()
         except Exception as e:
             log.debug(f"Stop sound error: {e}")
 
@@ -9,6 +9,51 @@ log = logging.getLogger(__name__)
 
 _stats_window = None
 
+# Stat card fonts and colors, looked up on the first show
+_styles = {}
+
+
+def _get_styles():
+    """Return the fonts and colors used by the stat cards."""
+    if not _styles:
+        from AppKit import NSFont, NSColor
+        _styles.update(
+            header_font=NSFont.boldSystemFontOfSize_(22),
+            title_font=NSFont.boldSystemFontOfSize_(12),
+            body_font=NSFont.systemFontOfSize_(13),
+            value_font=NSFont.monospacedDigitSystemFontOfSize_weight_(13, 0.5),
+            label=NSColor.labelColor(),
+            secondary=NSColor.secondaryLabelColor(),
+        )
+    return _styles
+
+
+def _make_text_field(frame, text, font, color, align=0):
+    """Create a read-only stat label."""
+    from AppKit import NSTextField
+    field = NSTextField.alloc().initWithFrame_(frame)
+    field.setValuesForKeysWithDictionary_({
+        "stringValue": text,
+        "font": font,
+        "textColor": color,
+        "bezeled": False,
+        "drawsBackground": False,
+        "editable": False,
+        "alignment": align,
+    })
+    return field
+
+
+# Display format for each statistic shown in the cards
+_STAT_FORMATS = {
+    "total_transcriptions": "{:,}",
+    "total_words": "{:,}",
+    "total_minutes": "{:.1f} min",
+    "avg_wpm": "{:.0f} WPM",
+    "today_count": "{:,}",
+    "today_words": "{:,}",
+}
+
 
 class StatisticsWindow:
     """Native macOS statistics window with modern styling."""
@@ -16,10 +61,13 @@ class StatisticsWindow:
     def __init__(self, stats: Dict):
         self.stats = stats
         self.window = None
+        self._rendered = {}
     
     def show(self):
         """Show the statistics window."""
         try:
+            # Format every value once up front; window building only reads strings
+            self._rendered = {key: fmt.format(self.stats[key]) for key, fmt in _STAT_FORMATS.items()}
             self._create_window()
         except Exception as e:
             log.error(f"Failed to show statistics: {e}")
@@ -31,12 +79,12 @@ class StatisticsWindow:
         from AppKit import (
             NSWindow, NSWindowStyleMaskTitled, NSWindowStyleMaskClosable,
             NSWindowStyleMaskFullSizeContentView, NSBackingStoreBuffered,
-            NSScreen, NSView, NSMakeRect, NSTextField, NSFont, NSColor, NSApp,
+            NSScreen, NSView, NSMakeRect, NSApp,
             NSVisualEffectView, NSVisualEffectBlendingModeBehindWindow,
             NSVisualEffectMaterialHUDWindow, NSVisualEffectStateActive, NSBox
         )
         
-        stats = self.stats
+        rendered = self._rendered
         
         # Window dimensions
         win_width = 380
@@ -76,14 +124,8 @@ class StatisticsWindow:
         y_pos = win_height - 50
         
         # Header
-        header_label = NSTextField.alloc().initWithFrame_(NSMakeRect(0, y_pos, win_width, 28))
-        header_label.setStringValue_("Statistics")
-        header_label.setFont_(NSFont.boldSystemFontOfSize_(22))
-        header_label.setTextColor_(NSColor.labelColor())
-        header_label.setBezeled_(False)
-        header_label.setDrawsBackground_(False)
-        header_label.setEditable_(False)
-        header_label.setAlignment_(1)
+        styles = _get_styles()
+        header_label = _make_text_field(NSMakeRect(0, y_pos, win_width, 28), "Statistics", styles['header_font'], styles['label'], align=1)
         vibrancy_view.addSubview_(header_label)
         
         y_pos -= 40
@@ -93,18 +135,18 @@ class StatisticsWindow:
         card_width = win_width - (card_margin * 2)
         
         self._add_stat_card(vibrancy_view, "All Time", [
-            ("Transcriptions", f"{stats['total_transcriptions']:,}"),
-            ("Words Typed", f"{stats['total_words']:,}"),
-            ("Recording Time", f"{stats['total_minutes']:.1f} min"),
-            ("Avg Speed", f"{stats['avg_wpm']:.0f} WPM"),
+            ("Transcriptions", rendered['total_transcriptions']),
+            ("Words Typed", rendered['total_words']),
+            ("Recording Time", rendered['total_minutes']),
+            ("Avg Speed", rendered['avg_wpm']),
         ], card_margin, y_pos - 105, card_width, 115)
         
         y_pos -= 140
         
         # Today Stats Card
         self._add_stat_card(vibrancy_view, "Today", [
-            ("Transcriptions", f"{stats['today_count']:,}"),
-            ("Words Typed", f"{stats['today_words']:,}"),
+            ("Transcriptions", rendered['today_count']),
+            ("Words Typed", rendered['today_words']),
         ], card_margin, y_pos - 65, card_width, 75)
         
         self.window.setContentView_(vibrancy_view)
@@ -117,7 +159,7 @@ class StatisticsWindow:
         """Add a statistics card with title and key-value pairs."""
         from AppKit import (
             NSVisualEffectView, NSVisualEffectStateActive,
-            NSTextField, NSFont, NSColor, NSMakeRect
+            NSColor, NSMakeRect
         )
         
         card = NSVisualEffectView.alloc().initWithFrame_(NSMakeRect(x, y, width, height))
@@ -131,40 +173,18 @@ class StatisticsWindow:
         card.layer().setBorderColor_(NSColor.separatorColor().CGColor())
         
         # Card title
-        title_label = NSTextField.alloc().initWithFrame_(NSMakeRect(15, height - 28, width - 30, 20))
-        title_label.setStringValue_(title)
-        title_label.setFont_(NSFont.boldSystemFontOfSize_(12))
-        title_label.setTextColor_(NSColor.secondaryLabelColor())
-        title_label.setBezeled_(False)
-        title_label.setDrawsBackground_(False)
-        title_label.setEditable_(False)
-        card.addSubview_(title_label)
-        
-        # Stats rows
-        row_y = height - 50
-        for label, value in stats_list:
-            # Label
-            label_field = NSTextField.alloc().initWithFrame_(NSMakeRect(15, row_y, 120, 18))
-            label_field.setStringValue_(label)
-            label_field.setFont_(NSFont.systemFontOfSize_(13))
-            label_field.setTextColor_(NSColor.labelColor())
-            label_field.setBezeled_(False)
-            label_field.setDrawsBackground_(False)
-            label_field.setEditable_(False)
-            card.addSubview_(label_field)
-            
-            # Value
-            value_field = NSTextField.alloc().initWithFrame_(NSMakeRect(140, row_y, width - 160, 18))
-            value_field.setStringValue_(value)
-            value_field.setFont_(NSFont.monospacedDigitSystemFontOfSize_weight_(13, 0.5))
-            value_field.setTextColor_(NSColor.labelColor())
-            value_field.setBezeled_(False)
-            value_field.setDrawsBackground_(False)
-            value_field.setEditable_(False)
-            value_field.setAlignment_(2)  # Right align
-            card.addSubview_(value_field)
-            
-            row_y -= 20
+        styles = _get_styles()
+        subviews = [
+            _make_text_field(NSMakeRect(15, height - 28, width - 30, 20), title, styles['title_font'], styles['secondary'])
+        ]
+        
+        # Stats rows, 20pt apart
+        row_ys = [height - 50 - 20 * i for i in range(len(stats_list))]
+        for (label, value), row_y in zip(stats_list, row_ys):
+            subviews.append(_make_text_field(NSMakeRect(15, row_y, 120, 18), label, styles['body_font'], styles['label']))
+            subviews.append(_make_text_field(NSMakeRect(140, row_y, width - 160, 18), value, styles['value_font'], styles['label'], align=2))  # Right align
+        
+        card.setSubviews_(subviews)
         
         parent_view.addSubview_(card)
 
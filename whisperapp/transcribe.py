@@ -1,59 +1,126 @@
 """Transcription module supporting multiple STT models."""
 
 import os
+import sys
 import logging
-from typing import Optional
+import threading
+from typing import Dict, Union
+
+import numpy as np
+
+from .models import AVAILABLE_MODELS, DEFAULT_MODEL, is_model_downloaded
 
 log = logging.getLogger('whisperapp.transcribe')
 
-# Lazy-loaded model instances
-_parakeet_model = None
-_current_model_key: Optional[str] = None
+# Used for unknown model keys
+_DEFAULT_MODEL_INFO = AVAILABLE_MODELS[DEFAULT_MODEL]
+
+# Lazy-loaded models by model_id, kept so switching back is instant
+_loaded_models: Dict[str, object] = {}
+_model_lock = threading.Lock()  # Keeps warmup and a first transcription from loading twice
 
 
 def _load_parakeet(model_id: str):
     """Load Parakeet model."""
-    global _parakeet_model
-    
     try:
         from parakeet_mlx import from_pretrained
         log.info(f"Loading Parakeet model: {model_id}")
-        _parakeet_model = from_pretrained(model_id)
+        model = from_pretrained(model_id)
         log.info("✓ Parakeet model loaded")
-        return _parakeet_model
+        return model
     except ImportError:
         raise ImportError("parakeet-mlx not installed. Run: pip install parakeet-mlx")
 
 
-def transcribe(audio_path: str, model_key: str = "parakeet") -> str:
+def _load_mlx_whisper(model_id: str):
+    """Load Whisper model."""
+    try:
+        import mlx.core as mx
+        from mlx_whisper.load_models import load_model
+    except ImportError:
+        raise ImportError("mlx-whisper not installed. Run: pip install mlx-whisper")
+    log.info(f"Loading Whisper model: {model_id}")
+    model = load_model(model_id, dtype=mx.float16)  # Matches fp16=True in transcribe()
+    log.info("✓ Whisper model loaded")
+    return model
+
+
+def _get_model(model_info):
+    """Return the loaded model for model_info, loading it on first use."""
+    model = _loaded_models.get(model_info.model_id)
+    if model is None:
+        with _model_lock:
+            model = _loaded_models.get(model_info.model_id)
+            if model is None:
+                load = _load_parakeet if model_info.model_type == "parakeet" else _load_mlx_whisper
+                model = _loaded_models[model_info.model_id] = load(model_info.model_id)
+    return model
+
+
+def unload_model(model_key: str) -> bool:
+    """
+    Drop a loaded model so its memory can be reclaimed.
+    
+    Returns:
+        True if the model was loaded
+    """
+    model_info = AVAILABLE_MODELS.get(model_key, _DEFAULT_MODEL_INFO)
+    with _model_lock:
+        model = _loaded_models.pop(model_info.model_id, None)
+    # mlx-whisper's own holder would otherwise keep the weights alive
+    whisper_module = sys.modules.get("mlx_whisper.transcribe")
+    if model is not None and whisper_module is not None and whisper_module.ModelHolder.model is model:
+        whisper_module.ModelHolder.model = None
+        whisper_module.ModelHolder.model_path = None
+    return model is not None
+
+
+def _transcribe_parakeet_array(model, audio: np.ndarray):
+    """Run Parakeet on in-memory 16 kHz mono samples, skipping its file loader."""
+    import mlx.core as mx
+    from parakeet_mlx.audio import get_logmel
+    
+    mel = get_logmel(mx.array(audio).astype(mx.bfloat16), model.preprocessor_config)
+    return model.generate(mel)[0]
+
+
+def transcribe(audio: Union[str, np.ndarray], model_key: str = "parakeet") -> str:
     """
-    Transcribe audio file using the specified model.
+    Transcribe audio using the specified model.
     
     Args:
-        audio_path: Path to WAV audio file
+        audio: Path to WAV audio file, or 16 kHz mono float32 samples
         model_key: Which model to use (parakeet, whisper-large, whisper-small, distil-whisper)
         
     Returns:
         Transcribed text string
     """
-    global _parakeet_model, _current_model_key
-    
-    if not os.path.exists(audio_path):
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    in_memory = isinstance(audio, np.ndarray)
+    if not in_memory and not os.path.exists(audio):
+        raise FileNotFoundError(f"Audio file not found: {audio}")
     
-    # Get model info
-    from .models import AVAILABLE_MODELS, DEFAULT_MODEL
-    model_info = AVAILABLE_MODELS.get(model_key, AVAILABLE_MODELS[DEFAULT_MODEL])
+    model_info = AVAILABLE_MODELS.get(model_key, _DEFAULT_MODEL_INFO)
     
-    log.debug(f"Transcribing with {model_info.name}: {audio_path}")
+    log.debug(f"Transcribing with {model_info.name}: {f'{len(audio)} samples' if in_memory else audio}")
     
     if model_info.model_type == "parakeet":
         # Use Parakeet
-        if _parakeet_model is None or _current_model_key != model_key:
-            _parakeet_model = _load_parakeet(model_info.model_id)
-            _current_model_key = model_key
+        model = _get_model(model_info)
         
-        result = _parakeet_model.transcribe(audio_path)
+        if not in_memory:
+            result = model.transcribe(audio)
+        else:
+            try:
+                result = _transcribe_parakeet_array(model, audio)
+            except (ImportError, AttributeError) as e:
+                # Parakeet build without the array entry points - go through a WAV file
+                from .recorder import write_temp_wav
+                log.debug(f"In-memory Parakeet input unavailable ({e}), using a WAV file")
+                wav_path = write_temp_wav(audio, 16000)
+                try:
+                    result = model.transcribe(wav_path)
+                finally:
+                    os.remove(wav_path)
         
         # Handle result format
         if hasattr(result, 'text'):
@@ -74,8 +141,15 @@ def transcribe(audio_path: str, model_key: str = "parakeet") -> str:
         
         log.info(f"Transcribing with Whisper model: {model_info.model_id}")
         
+        # mlx_whisper.transcribe looks the model up in ModelHolder, which holds a
+        # single model; hand it the cached one so switching doesn't reload weights
+        from mlx_whisper.transcribe import ModelHolder
+        ModelHolder.model = _get_model(model_info)
+        ModelHolder.model_path = model_info.model_id
+        
+        # mlx-whisper takes a path or 16 kHz float32 samples directly
         result = mlx_whisper.transcribe(
-            audio_path,
+            audio,
             path_or_hf_repo=model_info.model_id,
             language="en",  # Force English for speed
             fp16=True,
@@ -88,7 +162,22 @@ def transcribe(audio_path: str, model_key: str = "parakeet") -> str:
     return text.strip()
 
 
-def transcribe_with_timing(audio_path: str, model_key: str = "parakeet") -> dict:
+def warmup(model_key: str = "parakeet") -> bool:
+    """
+    Load a model and run it once on a short silence, so the first real
+    transcription doesn't pay for loading weights and compiling kernels.
+    
+    Blocks; call from a background thread. Models that aren't downloaded are
+    skipped. Returns True if the model was loaded and warmed.
+    """
+    if not is_model_downloaded(model_key):
+        return False
+    
+    transcribe(np.zeros(1600, dtype=np.float32), model_key=model_key)  # 0.1s at 16 kHz
+    return True
+
+
+def transcribe_with_timing(audio: Union[str, np.ndarray], model_key: str = "parakeet") -> dict:
     """
     Transcribe audio and return timing information.
     
@@ -98,7 +187,7 @@ def transcribe_with_timing(audio_path: str, model_key: str = "parakeet") -> dict
     import time
     
     start_time = time.time()
-    text = transcribe(audio_path, model_key=model_key)
+    text = transcribe(audio, model_key=model_key)
     duration = time.time() - start_time
     
     return {